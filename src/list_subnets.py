@@ -7,18 +7,55 @@ This script connects to the Bittensor network and lists information
 about all available subnets using the DynamicInfo API for Dynamic TAO.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import argparse
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache, partial
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Tuple
 
-import bittensor as bt
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 
+# bittensor takes seconds to import, so it is only loaded once a connection is needed
+if TYPE_CHECKING:
+    import bittensor as bt
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library serializer
+    orjson = None
+
+
+# Slots keep per-subnet records small, but need Python 3.10+
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SubnetInfo:
+    """Information collected about a single subnet."""
+    netuid: int
+    subnet_name: str = "Unknown"
+    symbol: str = "Unknown"
+    validators_count: int = 0
+    miners_count: int = 0
+    emission_value: float = 0.0
+    tempo: int = 0
+    last_update: int = 0
+    price: float = 0.0
+    debug: Dict[str, str] = field(default_factory=dict)  # To store debug information
+    error: Optional[str] = None
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -57,18 +94,157 @@ def parse_arguments():
         action="store_true",
         help="Perform deep inspection of emission values"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=None,
+        help="Number of subnets to query concurrently (default: 16)"
+    )
+    parser.add_argument(
+        "--legacy-metagraph", 
+        action="store_true",
+        help="Build a full metagraph per subnet instead of using the MetagraphInfo API"
+    )
+    parser.add_argument(
+        "--use-async", 
+        action="store_true",
+        help="Query subnets with the asyncio subtensor over a single connection"
+    )
+    parser.add_argument(
+        "--concurrency", 
+        type=int, 
+        default=None,
+        help="Maximum in-flight subnet queries with --use-async (default: 64)"
+    )
+    args = parser.parse_args()
+    
+    # These options only apply to one of the two fetching modes; reject them rather than ignore them
+    if args.use_async:
+        unsupported = [flag for flag, used in (
+            ("--workers", args.workers is not None),
+            ("--legacy-metagraph", args.legacy_metagraph),
+        ) if used]
+        if unsupported:
+            parser.error(f"{', '.join(unsupported)} cannot be used with --use-async")
+    elif args.concurrency is not None:
+        parser.error("--concurrency can only be used with --use-async")
+    
+    if args.workers is None:
+        args.workers = 16
+    if args.concurrency is None:
+        args.concurrency = 64
+    return args
+
+
+# bittensor's Balance type, resolved once bittensor has been imported
+_BALANCE_TYPE: Optional[type] = None
+
+
+def _load_balance_type():
+    """Remember bittensor's Balance type for the extract_emission_value fast path."""
+    global _BALANCE_TYPE
+    try:
+        from bittensor.utils.balance import Balance
+    except ImportError:
+        return
+    _BALANCE_TYPE = Balance
 
 
 def get_subtensor(endpoint: Optional[str] = None, network: str = "finney") -> bt.subtensor:
     """Initialize and return a subtensor connection."""
+    import bittensor as bt
+    
+    _load_balance_type()
     if endpoint:
         return bt.subtensor(network=network, chain_endpoint=endpoint)
     return bt.subtensor(network=network)
 
 
+def get_async_subtensor(endpoint: Optional[str] = None, network: str = "finney") -> bt.async_subtensor:
+    """Create an asyncio subtensor connection (use it with ``async with``)."""
+    import bittensor as bt
+    
+    _load_balance_type()
+    # The async subtensor takes a custom endpoint as its network
+    return bt.async_subtensor(network=endpoint or network)
+
+
+# One subtensor per thread, reused for every request that thread makes so the
+# websocket (and its TLS session) is only negotiated once per worker
+_subtensor_local = threading.local()
+
+# Every connection handed out by get_thread_subtensor, so they can be closed together
+_thread_subtensors: List[bt.subtensor] = []
+_thread_subtensors_lock = threading.Lock()
+
+
+def get_thread_subtensor(endpoint: Optional[str] = None, network: str = "finney") -> bt.subtensor:
+    """Return the calling thread's subtensor connection, creating it on first use."""
+    subtensor = getattr(_subtensor_local, "subtensor", None)
+    if subtensor is None:
+        subtensor = _subtensor_local.subtensor = get_subtensor(endpoint, network)
+        with _thread_subtensors_lock:
+            _thread_subtensors.append(subtensor)
+    return subtensor
+
+
+def close_thread_subtensors():
+    """Close the connections opened by get_thread_subtensor, once their threads are done."""
+    with _thread_subtensors_lock:
+        subtensors = list(_thread_subtensors)
+        _thread_subtensors.clear()
+    
+    for subtensor in subtensors:
+        try:
+            subtensor.close()
+        except Exception:
+            pass
+
+
+# Attribute (or dict key) names that may hold an emission amount, in order of preference
+_EMISSION_ATTRS = ('tao', 'value', 'amount', 'rao')
+
+# Attributes snapshotted into the debug output by --deep
+_DYNAMIC_INFO_DEBUG_ATTRS = (
+    'subnet_name', 'symbol', 'tempo', 'last_step', 'blocks_since_last_step',
+    'emission', 'alpha_in_emission', 'alpha_out_emission', 'tao_in_emission',
+    'pending_alpha_emission', 'pending_root_emission',
+    'price', 'moving_price', 'alpha_in', 'alpha_out', 'tao_in', 'subnet_volume',
+    'owner_hotkey', 'owner_coldkey', 'network_registered_at',
+)
+_METAGRAPH_DEBUG_ATTRS = (
+    'netuid', 'n', 'block', 'tempo', 'validator_permit', 'validators', 'neurons',
+    'S', 'stake', 'emission', 'incentive', 'dividends', 'uids',
+)
+
+
+def _debug_repr(value: Any) -> str:
+    """Return a cheap string form of a value, summarizing arrays and tensors."""
+    if hasattr(value, 'shape') and hasattr(value, 'dtype'):
+        # str() on a tensor formats every element
+        return f"<{type(value).__name__} shape={tuple(value.shape)} dtype={value.dtype}>"
+    return str(value)
+
+
+def count_nonzero(values: Any) -> int:
+    """Count the truthy entries of a list, numpy array or tensor."""
+    if values is None:
+        return 0
+    try:
+        return int(np.count_nonzero(np.asarray(values)))
+    except Exception:
+        return sum(1 for v in values if v)
+
+
 def extract_emission_value(obj: Any) -> float:
     """Helper to extract emission value from various object types."""
+    # Fast path for the types nearly every call sees; exact type checks skip the MRO walk
+    obj_type = type(obj)
+    if obj_type is float or obj_type is int:
+        return float(obj)
+    if obj_type is _BALANCE_TYPE:
+        return obj.tao
+    
     if obj is None:
         return 0.0
         
@@ -87,7 +263,7 @@ def extract_emission_value(obj: Any) -> float:
         pass
     
     # If it's an object with specific attributes
-    for attr in ['tao', 'value', 'amount', 'rao']:
+    for attr in _EMISSION_ATTRS:
         if hasattr(obj, attr):
             try:
                 return float(getattr(obj, attr))
@@ -96,7 +272,7 @@ def extract_emission_value(obj: Any) -> float:
     
     # If it's a dict
     if isinstance(obj, dict):
-        for key in ['tao', 'value', 'amount', 'rao']:
+        for key in _EMISSION_ATTRS:
             if key in obj:
                 try:
                     return float(obj[key])
@@ -106,318 +282,519 @@ def extract_emission_value(obj: Any) -> float:
     return 0.0
 
 
-def get_subnet_info(subtensor: bt.subtensor, netuid: int, console: Console, deep_inspection: bool = False) -> Dict[str, Any]:
-    """Get detailed information about a specific subnet using DynamicInfo API."""
-    result = {
-        "netuid": netuid,
-        "subnet_name": "Unknown",
-        "symbol": "Unknown",
-        "validators_count": 0,
-        "miners_count": 0,
-        "emission_value": 0.0,
-        "tempo": 0,
-        "last_update": 0,
-        "price": 0.0,
-        "debug": {},  # To store debug information
-        "error": None
-    }
+def emission_per_day(emission: float, tempo: int) -> float:
+    """Convert an emission per tempo into a daily value."""
+    blocks_per_day = 24 * 60 * 60 / 12  # assume 12 sec block time
+    return emission * (blocks_per_day / tempo)
+
+
+def apply_dynamic_info(result: SubnetInfo, dynamic_info: Any, deep_inspection: bool = False):
+    """Fill in subnet name, symbol, tempo, emission and price from a DynamicInfo."""
+    result.subnet_name = dynamic_info.subnet_name if hasattr(dynamic_info, 'subnet_name') else "Unknown"
+    result.symbol = dynamic_info.symbol if hasattr(dynamic_info, 'symbol') else "Unknown"
+    result.tempo = dynamic_info.tempo if hasattr(dynamic_info, 'tempo') else 0
+    
+    # Store the relevant attributes for debugging
+    if deep_inspection:
+        for attr_name in _DYNAMIC_INFO_DEBUG_ATTRS:
+            try:
+                attr_val = getattr(dynamic_info, attr_name)
+                result.debug[f"dynamic_info.{attr_name}"] = _debug_repr(attr_val)
+            except Exception:
+                pass
+    
+    # Get emission value with multiple approaches
+    if hasattr(dynamic_info, 'emission'):
+        emission_val = extract_emission_value(dynamic_info.emission)
+        if emission_val > 0:
+            result.emission_value = emission_val
+    
+    # Check for other emission-related attributes
+    for emission_attr in ['alpha_in_emission', 'tao_in_emission', 'pending_alpha_emission', 'pending_root_emission']:
+        if hasattr(dynamic_info, emission_attr) and result.emission_value == 0.0:
+            emission_val = extract_emission_value(getattr(dynamic_info, emission_attr))
+            if emission_val > 0:
+                result.emission_value = emission_val
+                break
+    
+    result.last_update = dynamic_info.last_step if hasattr(dynamic_info, 'last_step') else 0
+    
+    # Get price information
+    if hasattr(dynamic_info, 'price') and hasattr(dynamic_info.price, 'tao'):
+        result.price = float(dynamic_info.price.tao)
+
+
+def apply_metagraph_info(result: SubnetInfo, metagraph_info: Any, console: Console, deep_inspection: bool = False):
+    """Fill in validator and miner counts (and TAO emission, if still missing) from a MetagraphInfo.
+    
+    Must run after ``apply_dynamic_info``, whose price converts the alpha emission.
+    """
+    result.validators_count = count_nonzero(metagraph_info.validator_permit)
+    total_neurons = int(metagraph_info.num_uids or 0)
+    result.miners_count = max(0, total_neurons - result.validators_count)
+    
+    if result.emission_value == 0.0 and result.price > 0 and getattr(metagraph_info, 'emission', None):
+        # MetagraphInfo lists the emission of every neuron for one tempo, in the
+        # subnet's alpha; convert it to TAO with the price from DynamicInfo
+        try:
+            alpha_emission = sum(extract_emission_value(e) for e in metagraph_info.emission)
+            tempo = getattr(metagraph_info, 'tempo', None) or result.tempo
+            
+            if alpha_emission > 0 and tempo > 0:
+                result.emission_value = emission_per_day(alpha_emission * result.price, tempo)
+        except Exception as e:
+            if deep_inspection:
+                console.print(f"[yellow]Error calculating emission for subnet {result.netuid}: {str(e)}[/yellow]")
+
+
+def apply_subtensor_emission(result: SubnetInfo, emission: Any = None, emission_info: Any = None):
+    """Fill in emission from the per-subnet subtensor emission queries, when they returned anything."""
+    if emission is not None:
+        result.emission_value = extract_emission_value(emission)
+    
+    if emission_info is not None:
+        result.debug["emission_info"] = str(emission_info)
+        if hasattr(emission_info, 'emission'):
+            result.emission_value = extract_emission_value(emission_info.emission)
+
+
+def get_subnet_info(subtensor: bt.subtensor, netuid: int, console: Console, deep_inspection: bool = False,
+                    metagraph_info: Optional[Any] = None, block: Optional[int] = None,
+                    dynamic_info: Optional[Any] = None) -> SubnetInfo:
+    """Get detailed information about a specific subnet using DynamicInfo API.
+    
+    ``dynamic_info`` and ``metagraph_info`` (a ``MetagraphInfo`` or a record
+    from ``prefetch_metagraph_info``) may be passed in from the bulk queries;
+    only what is missing is queried for this subnet. All queries are made at
+    ``block`` (the chain head if None).
+    """
+    result = SubnetInfo(netuid=netuid)
     
     try:
         # Get dynamic subnet info
-        dynamic_info = None
         try:
-            # Try to use the new DynamicInfo API from Dynamic TAO
-            dynamic_info = subtensor.subnet(netuid)
+            # Try to use the new DynamicInfo API from Dynamic TAO, unless it was fetched up front
+            if dynamic_info is None:
+                dynamic_info = subtensor.subnet(netuid, block=block)
             
             if dynamic_info:
-                result["subnet_name"] = dynamic_info.subnet_name if hasattr(dynamic_info, 'subnet_name') else "Unknown"
-                result["symbol"] = dynamic_info.symbol if hasattr(dynamic_info, 'symbol') else "Unknown"
-                result["tempo"] = dynamic_info.tempo if hasattr(dynamic_info, 'tempo') else 0
-                
-                # Store all attributes for debugging
-                if deep_inspection:
-                    for attr_name in dir(dynamic_info):
-                        if not attr_name.startswith('_') and not callable(getattr(dynamic_info, attr_name)):
-                            try:
-                                attr_val = getattr(dynamic_info, attr_name)
-                                result["debug"][f"dynamic_info.{attr_name}"] = str(attr_val)
-                            except Exception:
-                                pass
-                
-                # Get emission value with multiple approaches
-                if hasattr(dynamic_info, 'emission'):
-                    emission_val = extract_emission_value(dynamic_info.emission)
-                    if emission_val > 0:
-                        result["emission_value"] = emission_val
-                
-                # Check for other emission-related attributes
-                for emission_attr in ['alpha_in_emission', 'tao_in_emission', 'pending_alpha_emission', 'pending_root_emission']:
-                    if hasattr(dynamic_info, emission_attr) and result["emission_value"] == 0.0:
-                        emission_val = extract_emission_value(getattr(dynamic_info, emission_attr))
-                        if emission_val > 0:
-                            result["emission_value"] = emission_val
-                            break
-                
-                result["last_update"] = dynamic_info.last_step if hasattr(dynamic_info, 'last_step') else 0
-                
-                # Get price information
-                if hasattr(dynamic_info, 'price') and hasattr(dynamic_info.price, 'tao'):
-                    result["price"] = float(dynamic_info.price.tao)
+                apply_dynamic_info(result, dynamic_info, deep_inspection)
         except Exception as e:
             if deep_inspection:
                 console.print(f"[yellow]Dynamic API error for subnet {netuid}: {str(e)}[/yellow]")
             # If DynamicInfo API fails, we'll still try to get some data via Metagraph
             pass
         
-        # Always try to get metagraph data for validators and miners
-        try:
-            metagraph = bt.metagraph(netuid=netuid, subtensor=subtensor)
-            
-            # Store all metagraph attributes for debugging
-            if deep_inspection:
-                for attr_name in dir(metagraph):
-                    if not attr_name.startswith('_') and not callable(getattr(metagraph, attr_name)):
+        metagraph = None
+        if metagraph_info is not None:
+            # Use the validator permits and neuron count fetched for all subnets up front
+            apply_metagraph_info(result, metagraph_info, console, deep_inspection)
+        else:
+            # Fall back to building a metagraph for validators and miners
+            try:
+                import bittensor as bt
+                
+                metagraph = bt.metagraph(netuid=netuid, subtensor=subtensor, sync=False)
+                metagraph.sync(block=block, subtensor=subtensor)
+                
+                # Store the relevant metagraph attributes for debugging
+                if deep_inspection:
+                    for attr_name in _METAGRAPH_DEBUG_ATTRS:
                         try:
                             attr_val = getattr(metagraph, attr_name)
-                            result["debug"][f"metagraph.{attr_name}"] = str(type(attr_val))
+                            result.debug[f"metagraph.{attr_name}"] = _debug_repr(attr_val) if hasattr(attr_val, 'shape') else str(type(attr_val))
                         except Exception:
                             pass
-            
-            # Try multiple approaches to get validator count
-            if hasattr(metagraph, 'validator_permit'):
-                # Count validators with permits
-                result["validators_count"] = sum(1 for p in metagraph.validator_permit if p)
-            elif hasattr(metagraph, 'validators'):
-                # Use validators attribute directly
-                result["validators_count"] = len(metagraph.validators)
-            elif hasattr(metagraph, 'S') and hasattr(metagraph, 'neurons'):
-                # Count neurons with non-zero stake as validators
-                result["validators_count"] = sum(1 for s in metagraph.S if s > 0)
-            
-            if hasattr(metagraph, 'n'):
-                # Total number of neurons
-                total_neurons = int(metagraph.n)
-            elif hasattr(metagraph, 'neurons'):
-                total_neurons = len(metagraph.neurons)
-            else:
-                total_neurons = 0
                 
-            result["miners_count"] = max(0, total_neurons - result["validators_count"])
-            
-            # If we couldn't get emission via DynamicInfo, try via metagraph
-            if result["emission_value"] == 0.0:
-                # Try all possible approaches to get emissions
-                if hasattr(metagraph, 'emission'):
+                # Try multiple approaches to get validator count
+                if hasattr(metagraph, 'validator_permit'):
+                    # Count validators with permits
+                    result.validators_count = count_nonzero(metagraph.validator_permit)
+                elif hasattr(metagraph, 'validators'):
+                    # Use validators attribute directly
+                    result.validators_count = len(metagraph.validators)
+                elif hasattr(metagraph, 'S') and hasattr(metagraph, 'neurons'):
+                    # Count neurons with non-zero stake as validators
                     try:
-                        if deep_inspection:
-                            console.print(f"[cyan]Subnet {netuid} emission type: {type(metagraph.emission)}[/cyan]")
-                        
-                        emission = extract_emission_value(metagraph.emission)
-                        
-                        if emission > 0 and hasattr(metagraph, 'tempo') and metagraph.tempo > 0:
-                            # Convert to daily value
-                            blocks_per_day = 24 * 60 * 60 / 12  # assume 12 sec block time
-                            emission_per_block = emission
-                            emission_per_day = emission_per_block * (blocks_per_day / metagraph.tempo)
-                            result["emission_value"] = emission_per_day
-                    except Exception as e:
-                        if deep_inspection:
-                            console.print(f"[yellow]Error calculating emission for subnet {netuid}: {str(e)}[/yellow]")
+                        result.validators_count = int(np.count_nonzero(np.asarray(metagraph.S) > 0))
+                    except Exception:
+                        result.validators_count = sum(1 for s in metagraph.S if s > 0)
                 
-                # Also try to get emission information from subtensor
-                try:
-                    # This method may exist in some Bittensor versions
-                    if hasattr(subtensor, 'get_emission_value_by_subnet'):
-                        emission = subtensor.get_emission_value_by_subnet(netuid=netuid)
-                        result["emission_value"] = extract_emission_value(emission)
-                except Exception:
-                    pass
+                if hasattr(metagraph, 'n'):
+                    # Total number of neurons
+                    total_neurons = int(metagraph.n)
+                elif hasattr(metagraph, 'neurons'):
+                    total_neurons = len(metagraph.neurons)
+                else:
+                    total_neurons = 0
                     
-                # Try to get emissions via DTAO methods
+                result.miners_count = max(0, total_neurons - result.validators_count)
+                
+            except Exception as e:
+                if deep_inspection:
+                    console.print(f"[yellow]Metagraph error for subnet {netuid}: {str(e)}[/yellow]")
+        
+        # If we couldn't get emission via DynamicInfo, try via metagraph
+        if result.emission_value == 0.0:
+            # Try all possible approaches to get emissions
+            if metagraph is not None and hasattr(metagraph, 'emission'):
                 try:
-                    if deep_inspection and hasattr(subtensor, 'get_subnet_emission_info'):
-                        emission_info = subtensor.get_subnet_emission_info(netuid=netuid)
-                        result["debug"]["emission_info"] = str(emission_info)
-                        if emission_info and hasattr(emission_info, 'emission'):
-                            result["emission_value"] = extract_emission_value(emission_info.emission)
-                except Exception:
-                    pass
+                    if deep_inspection:
+                        console.print(f"[cyan]Subnet {netuid} emission type: {type(metagraph.emission)}[/cyan]")
+                    
+                    emission = extract_emission_value(metagraph.emission)
+                    
+                    if emission > 0 and hasattr(metagraph, 'tempo') and metagraph.tempo > 0:
+                        result.emission_value = emission_per_day(emission, metagraph.tempo)
+                except Exception as e:
+                    if deep_inspection:
+                        console.print(f"[yellow]Error calculating emission for subnet {netuid}: {str(e)}[/yellow]")
+            
+            # Also try to get emission information from subtensor
+            emission = emission_info = None
+            try:
+                # This method may exist in some Bittensor versions
+                if hasattr(subtensor, 'get_emission_value_by_subnet'):
+                    emission = subtensor.get_emission_value_by_subnet(netuid=netuid, block=block)
+            except Exception:
+                pass
                 
+            # Try to get emissions via DTAO methods
+            try:
+                if deep_inspection and hasattr(subtensor, 'get_subnet_emission_info'):
+                    emission_info = subtensor.get_subnet_emission_info(netuid=netuid, block=block)
+            except Exception:
+                pass
+            
+            apply_subtensor_emission(result, emission, emission_info)
+            
+    except Exception as e:
+        result.error = str(e)
+    
+    return result
+
+
+async def get_subnet_info_async(subtensor: bt.async_subtensor, netuid: int, console: Console, deep_inspection: bool = False,
+                                metagraph_info: Optional[Any] = None, block: Optional[int] = None,
+                                dynamic_info: Optional[Any] = None) -> SubnetInfo:
+    """Get detailed information about a specific subnet using the asyncio subtensor.
+    
+    Mirrors ``get_subnet_info``, except that there is no per-subnet metagraph
+    fallback: counts come from ``metagraph_info`` or ``get_metagraph_info``.
+    """
+    result = SubnetInfo(netuid=netuid)
+    
+    try:
+        try:
+            # Only query the DynamicInfo if it was not fetched up front
+            if dynamic_info is None:
+                dynamic_info = await subtensor.subnet(netuid, block=block)
+            if dynamic_info:
+                apply_dynamic_info(result, dynamic_info, deep_inspection)
+        except Exception as e:
+            if deep_inspection:
+                console.print(f"[yellow]Dynamic API error for subnet {netuid}: {str(e)}[/yellow]")
+        
+        try:
+            if metagraph_info is None:
+                metagraph_info = await subtensor.get_metagraph_info(netuid, block=block)
+            if metagraph_info is not None:
+                apply_metagraph_info(result, metagraph_info, console, deep_inspection)
         except Exception as e:
             if deep_inspection:
                 console.print(f"[yellow]Metagraph error for subnet {netuid}: {str(e)}[/yellow]")
+        
+        # If we couldn't get emission via DynamicInfo or MetagraphInfo, try via subtensor
+        if result.emission_value == 0.0:
+            emission = emission_info = None
+            try:
+                # This method may exist in some Bittensor versions
+                if hasattr(subtensor, 'get_emission_value_by_subnet'):
+                    emission = await subtensor.get_emission_value_by_subnet(netuid=netuid, block=block)
+            except Exception:
+                pass
+                
+            # Try to get emissions via DTAO methods
+            try:
+                if deep_inspection and hasattr(subtensor, 'get_subnet_emission_info'):
+                    emission_info = await subtensor.get_subnet_emission_info(netuid=netuid, block=block)
+            except Exception:
+                pass
+            
+            apply_subtensor_emission(result, emission, emission_info)
             
     except Exception as e:
-        result["error"] = str(e)
+        result.error = str(e)
     
     return result
 
 
-def list_all_subnets(subtensor: bt.subtensor, deep_inspection: bool = False) -> List[Dict[str, Any]]:
+def prefetch_metagraph_info(subtensor: bt.subtensor, netuids: List[int], block_hash: str) -> Dict[int, SimpleNamespace]:
+    """Fetch validator permits and neuron counts for all subnets in one batched storage query."""
+    substrate = subtensor.substrate
+    
+    storage_keys = [
+        substrate.create_storage_key("SubtensorModule", storage_function, [netuid], block_hash=block_hash)
+        for netuid in netuids
+        for storage_function in ("ValidatorPermit", "SubnetworkN")
+    ]
+    
+    records = {netuid: SimpleNamespace(netuid=netuid, validator_permit=None, num_uids=None) for netuid in netuids}
+    
+    # Each value comes back with its storage key, which tells which subnet and map it belongs to
+    for storage_key, value in substrate.query_multi(storage_keys, block_hash=block_hash):
+        record = records.get(storage_key.params[0])
+        if record is None:
+            continue
+        value = getattr(value, "value", value)
+        if storage_key.storage_function == "ValidatorPermit":
+            record.validator_permit = value
+        elif storage_key.storage_function == "SubnetworkN":
+            record.num_uids = value
+    
+    # Only keep subnets for which both values were returned
+    return {
+        netuid: record for netuid, record in records.items()
+        if record.validator_permit is not None and record.num_uids is not None
+    }
+
+
+def collect_subnet_info(netuids: List[int], fetch: Callable[[int], SubnetInfo], console: Console, workers: int) -> List[SubnetInfo]:
+    """Fetch subnet information for each netuid concurrently, sorted by netuid."""
+    subnets_info = []
+    
+    # Create a nicely formatted progress display; it is only ever updated from
+    # this (main) thread, and a lower refresh rate keeps its lock uncontended
+    with Progress(console=console, refresh_per_second=4, transient=True) as progress:
+        task = progress.add_task("[cyan]Processing subnet data...", total=len(netuids))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = {executor.submit(fetch, netuid): netuid for netuid in netuids}
+                
+                for future in as_completed(futures):
+                    try:
+                        subnets_info.append(future.result())
+                    except Exception as e:
+                        console.print(f"[yellow]Could not retrieve subnet {futures[future]}: {str(e)}[/yellow]")
+                    progress.update(task, advance=1)
+        finally:
+            # The worker threads have exited, so their connections are no longer needed
+            close_thread_subtensors()
+    
+    # Keep the display order deterministic regardless of completion order
+    subnets_info.sort(key=lambda info: info.netuid)
+    return subnets_info
+
+
+def list_all_subnets(subtensor: bt.subtensor, console: Console, deep_inspection: bool = False, endpoint: Optional[str] = None,
+                     network: str = "finney", workers: int = 16, legacy_metagraph: bool = False) -> List[SubnetInfo]:
     """List all subnets and their information."""
-    console = Console()
+    # The subtensor websocket is not thread-safe, so every worker gets its own connection
+    thread_subtensor = partial(get_thread_subtensor, endpoint, network)
+    dynamic_infos: Dict[int, Any] = {}
+    prefetched: Dict[int, Any] = {}
+    
+    block = None
+    block_hash = None
+    
+    def fetch(netuid: int) -> SubnetInfo:
+        return get_subnet_info(thread_subtensor(), netuid, console, deep_inspection, prefetched.get(netuid), block,
+                               dynamic_infos.get(netuid))
+    
+    def prefetch(netuids: List[int]):
+        if legacy_metagraph:
+            return
+        
+        # Get the metagraph info of every subnet in a single call
+        try:
+            metagraphs_info = subtensor.get_all_metagraphs_info(block=block)
+            prefetched.update({m.netuid: m for m in metagraphs_info if m is not None})
+            return
+        except Exception as e:
+            console.print(f"[yellow]Could not use MetagraphInfo API: {str(e)}[/yellow]")
+        
+        # Fall back to a batched storage query
+        try:
+            prefetched.update(prefetch_metagraph_info(subtensor, netuids, block_hash))
+        except Exception as e:
+            console.print(f"[yellow]Could not batch metagraph queries, falling back to per-subnet metagraphs: {str(e)}[/yellow]")
     
     try:
+        # Pin every query to the same block so the report is one consistent snapshot
+        block = subtensor.get_current_block()
+        block_hash = subtensor.get_block_hash(block)
+        
         # Try to get information for all subnets at once using the DynamicInfo API
-        all_subnets_info = []
         try:
-            dynamic_infos = subtensor.all_subnets()
+            dynamic_infos.update({dynamic_info.netuid: dynamic_info for dynamic_info in subtensor.all_subnets(block=block)})
             console.print("[green]Successfully retrieved subnet information using DynamicInfo API[/green]")
-            
-            # Create a nicely formatted progress display
-            with Progress() as progress:
-                task = progress.add_task("[cyan]Processing subnet data...", total=len(dynamic_infos))
-                
-                for dynamic_info in dynamic_infos:
-                    netuid = dynamic_info.netuid
-                    subnet_info = get_subnet_info(subtensor, netuid, console, deep_inspection)
-                    all_subnets_info.append(subnet_info)
-                    progress.update(task, advance=1)
-                    
-            return all_subnets_info
+            netuids = list(dynamic_infos)
             
         except Exception as e:
             console.print(f"[yellow]Could not use DynamicInfo API: {str(e)}[/yellow]")
             
-        # Fall back to getting subnets one by one
-        total_subnets = subtensor.get_total_subnets()
-        console.print(f"[yellow]Falling back to retrieving subnet information one by one. Total subnets: {total_subnets}[/yellow]")
+            # Fall back to getting subnets one by one
+            total_subnets = subtensor.get_total_subnets(block=block)
+            console.print(f"[yellow]Falling back to retrieving subnet information one by one. Total subnets: {total_subnets}[/yellow]")
+            netuids = list(range(total_subnets))
+        
+        prefetch(netuids)
         
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Processing subnet data...", total=total_subnets)
+        # Subnets covered by both bulk calls need no per-subnet DynamicInfo or metagraph queries
+        covered = [netuid for netuid in netuids if netuid in dynamic_infos and netuid in prefetched]
+        subnets_info = [
+            get_subnet_info(subtensor, netuid, console, deep_inspection, prefetched[netuid], block, dynamic_infos[netuid])
+            for netuid in covered
+        ]
+        
+        # Only the rest go through the worker pool, one subnet at a time
+        remaining = [netuid for netuid in netuids if not (netuid in dynamic_infos and netuid in prefetched)]
+        if remaining:
+            subnets_info.extend(collect_subnet_info(remaining, fetch, console, workers))
+        
+        subnets_info.sort(key=lambda info: info.netuid)
+        return subnets_info
+        
+    except Exception as e:
+        console.print(f"[red]Error getting subnet list: {str(e)}[/red]")
+        return []
+
+
+async def list_all_subnets_async(console: Console, endpoint: Optional[str] = None, network: str = "finney",
+                                 deep_inspection: bool = False, concurrency: int = 64) -> List[SubnetInfo]:
+    """List all subnets and their information, multiplexing queries over one asyncio connection."""
+    try:
+        async with get_async_subtensor(endpoint, network) as subtensor:
+            # Pin every query to the same block so the report is one consistent snapshot
+            block = await subtensor.get_current_block()
             
-            for netuid in range(total_subnets):
-                subnet_info = get_subnet_info(subtensor, netuid, console, deep_inspection)
-                all_subnets_info.append(subnet_info)
-                progress.update(task, advance=1)
+            # Try to get information for all subnets at once using the DynamicInfo API
+            dynamic_infos: Dict[int, Any] = {}
+            try:
+                dynamic_infos = {
+                    dynamic_info.netuid: dynamic_info
+                    for dynamic_info in await subtensor.all_subnets(block_number=block)
+                }
+                console.print("[green]Successfully retrieved subnet information using DynamicInfo API[/green]")
+                netuids = list(dynamic_infos)
+            except Exception as e:
+                console.print(f"[yellow]Could not use DynamicInfo API: {str(e)}[/yellow]")
                 
-        return all_subnets_info
+                # Fall back to getting subnets one by one
+                total_subnets = await subtensor.get_total_subnets(block=block)
+                console.print(f"[yellow]Falling back to retrieving subnet information one by one. Total subnets: {total_subnets}[/yellow]")
+                netuids = list(range(total_subnets))
+            
+            # Get the metagraph info of every subnet in a single call, falling back to one call per subnet
+            try:
+                metagraphs_info = await subtensor.get_all_metagraphs_info(block=block)
+                prefetched = {m.netuid: m for m in metagraphs_info if m is not None}
+            except Exception as e:
+                console.print(f"[yellow]Could not use MetagraphInfo API: {str(e)}[/yellow]")
+                prefetched = {}
+            
+            # Bound the in-flight requests so the endpoint is not overwhelmed
+            semaphore = asyncio.Semaphore(max(1, concurrency))
+            
+            async def fetch(netuid: int) -> SubnetInfo:
+                async with semaphore:
+                    return await get_subnet_info_async(subtensor, netuid, console, deep_inspection, prefetched.get(netuid), block,
+                                                       dynamic_infos.get(netuid))
+            
+            subnets_info = []
+            with Progress(console=console, refresh_per_second=4, transient=True) as progress:
+                task = progress.add_task("[cyan]Processing subnet data...", total=len(netuids))
+                
+                for next_result in asyncio.as_completed([fetch(netuid) for netuid in netuids]):
+                    subnets_info.append(await next_result)
+                    progress.update(task, advance=1)
+            
+            # Keep the display order deterministic regardless of completion order
+            subnets_info.sort(key=lambda info: info.netuid)
+            return subnets_info
         
     except Exception as e:
         console.print(f"[red]Error getting subnet list: {str(e)}[/red]")
         return []
 
 
+# ASCII names for Hebrew and Arabic symbols, which many terminals render poorly.
+# Any other symbol is displayed as-is.
+_SYMBOL_MAP = {
+    # Hebrew (potentially problematic)
+    'א': 'alef',
+    'ב': 'bet',
+    'ג': 'gimel',
+    'ד': 'dalet',
+    'ה': 'he',
+    'ו': 'vav',
+    'ז': 'zayin',
+    'ח': 'het',
+    'ט': 'tet',
+    'י': 'yod',
+    'ך': 'kaf-sofit',
+    'כ': 'kaf',
+    'ל': 'lamed',
+    'ם': 'mem-sofit',
+    'מ': 'mem',
+    'ן': 'nun-sofit',
+    'נ': 'nun',
+    'ס': 'samekh',
+    'ע': 'ayin',
+    'ף': 'pe-sofit',
+    'פ': 'pe',
+    'ץ': 'tsadi-sofit',
+    'צ': 'tsadi',
+    'ק': 'qof',
+    'ר': 'resh',
+    'ש': 'shin',
+    'ת': 'tav',
+    
+    # Arabic (potentially problematic)
+    'ا': 'alif',
+    'ب': 'ba',
+    'ت': 'ta',
+    'ث': 'tha',
+    'ج': 'jim',
+    'ح': 'ha',
+    'خ': 'kha',
+    'د': 'dal',
+    'ذ': 'dhal',
+    'ر': 'ra',
+    'ز': 'zay',
+    'س': 'sin',
+    'ش': 'shin',
+    'ص': 'sad',
+    'ض': 'dad',
+    'ط': 'ta',
+    'ظ': 'za',
+    'ع': 'ayn',
+    'غ': 'ghayn',
+    'ف': 'fa',
+    'ق': 'qaf',
+    'ك': 'kaf',
+    'ل': 'lam',
+    'م': 'mim',
+    'ن': 'nun',
+    'ه': 'ha',
+    'و': 'waw',
+    'ي': 'ya',
+    'ى': 'alif',
+}
+
+
+@lru_cache(maxsize=256)
 def get_symbol_representation(symbol: str) -> str:
     """Convert a symbol to a representation that can be displayed in all terminals."""
-    if not symbol or symbol == "Unknown":
+    if not symbol:
         return "Unknown"
-        
-    # Mapping dictionary for special symbols
-    symbol_map = {
-        # Greek (UTF-8 display generally correct)
-        'Τ': 'Τ (T)',  # Tau (Root)
-        'α': 'α',  # alpha
-        'β': 'β',  # beta
-        'γ': 'γ',  # gamma
-        'δ': 'δ',  # delta
-        'ε': 'ε',  # epsilon
-        'ζ': 'ζ',  # zeta
-        'η': 'η',  # eta
-        'θ': 'θ', # theta
-        'ι': 'ι',  # iota
-        'κ': 'κ',  # kappa
-        'λ': 'λ',  # lambda
-        'μ': 'μ',  # mu
-        'ν': 'ν',  # nu
-        'ξ': 'ξ',  # xi
-        'ο': 'ο',  # omicron
-        'π': 'π',  # pi
-        'ρ': 'ρ',  # rho
-        'σ': 'σ',  # sigma
-        'τ': 'τ',  # tau
-        'υ': 'υ',  # upsilon
-        'φ': 'φ', # phi
-        'χ': 'χ', # chi
-        'ψ': 'ψ', # psi
-        'ω': 'ω',  # omega
-        
-        # Hebrew (potentially problematic)
-        'א': 'alef',
-        'ב': 'bet',
-        'ג': 'gimel',
-        'ד': 'dalet',
-        'ה': 'he',
-        'ו': 'vav',
-        'ז': 'zayin',
-        'ח': 'het',
-        'ט': 'tet',
-        'י': 'yod',
-        'ך': 'kaf-sofit',
-        'כ': 'kaf',
-        'ל': 'lamed',
-        'ם': 'mem-sofit',
-        'מ': 'mem',
-        'ן': 'nun-sofit',
-        'נ': 'nun',
-        'ס': 'samekh',
-        'ע': 'ayin',
-        'ף': 'pe-sofit',
-        'פ': 'pe',
-        'ץ': 'tsadi-sofit',
-        'צ': 'tsadi',
-        'ק': 'qof',
-        'ר': 'resh',
-        'ש': 'shin',
-        'ת': 'tav',
-        
-        # Arabic (potentially problematic)
-        'ا': 'alif',
-        'ب': 'ba',
-        'ت': 'ta',
-        'ث': 'tha',
-        'ج': 'jim',
-        'ح': 'ha',
-        'خ': 'kha',
-        'د': 'dal',
-        'ذ': 'dhal',
-        'ر': 'ra',
-        'ز': 'zay',
-        'س': 'sin',
-        'ش': 'shin',
-        'ص': 'sad',
-        'ض': 'dad',
-        'ط': 'ta',
-        'ظ': 'za',
-        'ع': 'ayn',
-        'غ': 'ghayn',
-        'ف': 'fa',
-        'ق': 'qaf',
-        'ك': 'kaf',
-        'ل': 'lam',
-        'م': 'mim',
-        'ن': 'nun',
-        'ه': 'ha',
-        'و': 'waw',
-        'ي': 'ya',
-        'ى': 'alif',
-        
-        # Other special characters
-        'ᚠ': 'fehu',  # Rune
-    }
-    
-    # Check if the symbol is a Hebrew or Arabic character
-    if '\u0590' <= symbol <= '\u06FF':  # Unicode range for Hebrew and Arabic
-        return symbol_map.get(symbol, symbol)
-    
-    # For other characters, try to display them normally
-    try:
-        # Simple encoding test
-        symbol.encode('utf-8')
-        return symbol
-    except UnicodeEncodeError:
-        # Fallback in case of problems
-        if symbol in symbol_map:
-            return symbol_map[symbol]
-        else:
-            return f"U+{ord(symbol):04X}" if len(symbol) == 1 else "?"
+    return _SYMBOL_MAP.get(symbol, symbol)
 
 
-def display_subnets(subnet_data: List[Dict[str, Any]], use_color: bool = True, show_debug: bool = False):
+def display_subnets(subnet_data: List[SubnetInfo], console: Console, show_debug: bool = False):
     """Display subnet information in a formatted table."""
-    console = Console(highlight=use_color, color_system="auto" if use_color else None)
-    
-    table = Table(show_header=True, header_style="bold magenta")
+    table = Table(show_header=True, header_style="bold magenta", show_lines=False)
     table.add_column("Subnet ID")
     table.add_column("Name")
     table.add_column("Symbol")
@@ -434,33 +811,31 @@ def display_subnets(subnet_data: List[Dict[str, Any]], use_color: bool = True, s
     for subnet in subnet_data:
         # Only show subnets where we at least have some data
         has_data = (
-            subnet.get("validators_count", 0) > 0 or 
-            subnet.get("miners_count", 0) > 0 or 
-            subnet.get("emission_value", 0) > 0 or
-            subnet.get("subnet_name", "Unknown") != "Unknown" or
-            subnet.get("symbol", "Unknown") != "Unknown"
+            subnet.validators_count > 0 or 
+            subnet.miners_count > 0 or 
+            subnet.emission_value > 0 or
+            subnet.subnet_name != "Unknown" or
+            subnet.symbol != "Unknown"
         )
         
         if has_data or show_debug:
             active_subnets += 1
             
             # Convert symbol with our function
-            symbol = get_symbol_representation(subnet.get("symbol", "Unknown"))
+            symbol = get_symbol_representation(subnet.symbol)
             
-            row = [
-                str(subnet["netuid"]),
-                subnet.get("subnet_name", "Unknown"),
+            row = (
+                str(subnet.netuid),
+                subnet.subnet_name,
                 symbol,
-                str(subnet.get("validators_count", 0)),
-                str(subnet.get("miners_count", 0)),
-                f"{subnet.get('emission_value', 0):.6f}",
-                f"{subnet.get('price', 0):.6f}"
-            ]
+                str(subnet.validators_count),
+                str(subnet.miners_count),
+                f"{subnet.emission_value:.6f}",
+                f"{subnet.price:.6f}"
+            )
             
-            if show_debug and "error" in subnet and subnet["error"]:
-                row.append(str(subnet["error"]))
-            elif show_debug:
-                row.append("")
+            if show_debug:
+                row += (str(subnet.error) if subnet.error else "",)
                 
             table.add_row(*row)
     
@@ -470,15 +845,20 @@ def display_subnets(subnet_data: List[Dict[str, Any]], use_color: bool = True, s
     console.print("\nCreated by [bold]Graytensor[/bold] - taotrack.com")
 
 
-def save_to_file(subnet_data: List[Dict[str, Any]], output_path: str):
+def save_to_file(subnet_data: List[SubnetInfo], output_path: str):
     """Save subnet data to a JSON file."""
     output_data = {
         "timestamp": datetime.now().isoformat(),
         "total_subnets": len(subnet_data),
-        "subnets": subnet_data,
+        "subnets": [asdict(subnet) for subnet in subnet_data],
         "powered_by": "Graytensor - taotrack.com"
     }
     
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    
     with open(output_path, 'w') as f:
         json.dump(output_data, f, indent=2)
 
@@ -487,15 +867,23 @@ def main():
     """Main function."""
     args = parse_arguments()
     
+    # A single console for all output; highlighting only runs regexes over the plain numbers in each cell
+    console = Console(highlight=False, color_system=None if args.no_color else "auto")
+    
     try:
-        # Initialize subtensor connection
-        subtensor = get_subtensor(args.endpoint, args.network)
-        
-        # Get subnet information
-        subnet_data = list_all_subnets(subtensor, args.deep)
+        if args.use_async:
+            # Get subnet information over a single asyncio connection
+            subnet_data = asyncio.run(list_all_subnets_async(console, args.endpoint, args.network, args.deep, args.concurrency))
+        else:
+            # Initialize subtensor connection
+            subtensor = get_subtensor(args.endpoint, args.network)
+            
+            # Get subnet information
+            subnet_data = list_all_subnets(subtensor, console, args.deep, args.endpoint, args.network, args.workers,
+                                           args.legacy_metagraph)
         
         # Display subnet information
-        display_subnets(subnet_data, not args.no_color, args.debug)
+        display_subnets(subnet_data, console, args.debug)
         
         # Save to file if output path is provided
         if args.output: